@@ -12,10 +12,22 @@ import warnings
 
 from ..models import SecurityConfig
 
+# Current RSS on Linux comes from /proc/self/statm: one short read, with
+# field 2 holding the resident page count. getrusage's ru_maxrss is NOT
+# usable here - it is the peak high-water mark and never goes back down,
+# so cleanup would never be observed by limit checks.
+_STATM_PATH = '/proc/self/statm'
+_HAS_STATM = os.path.exists(_STATM_PATH)
+_PAGE_SIZE = os.sysconf('SC_PAGE_SIZE') if hasattr(os, 'sysconf') else 4096
+
+# Check the memory limit before every Nth decorated call; consecutive calls
+# almost always observe the same RSS, so sampling each one is wasted work.
+MEMORY_CHECK_INTERVAL = 16
+
 
 class MemoryManager:
     """Manages memory usage and cleanup."""
-    
+
     def __init__(self, security_config: Optional[SecurityConfig] = None):
         self.config = security_config or SecurityConfig()
         self.process = psutil.Process(os.getpid())
@@ -23,9 +35,26 @@ class MemoryManager:
         self._monitor_thread = None
         self._monitoring = False
         self._callbacks = []
-    
+
     def get_memory_usage_mb(self) -> float:
-        """Get current memory usage in MB."""
+        """
+        Get current memory usage (resident set size) in MB.
+
+        On Linux this is a single short read of /proc/self/statm, versus
+        psutil parsing the much larger /proc/self/status; other platforms
+        fall back to psutil. Unlike a peak metric, this goes back down
+        after cleanup, which the limit-check retry logic relies on.
+        """
+        if _HAS_STATM:
+            try:
+                fd = os.open(_STATM_PATH, os.O_RDONLY)
+                try:
+                    statm = os.read(fd, 128)
+                finally:
+                    os.close(fd)
+                return int(statm.split()[1]) * _PAGE_SIZE / (1024 * 1024)
+            except (OSError, ValueError, IndexError):
+                pass
         return self.process.memory_info().rss / (1024 * 1024)
     
     def get_memory_percent(self) -> float:
@@ -43,29 +72,33 @@ class MemoryManager:
     
     def force_cleanup(self):
         """Force garbage collection and memory cleanup."""
-        # Clear any caches
-        gc.collect()
-        
-        # Force full collection
-        for _ in range(3):
-            gc.collect(2)
+        # A single full (generation 2) collection walks every tracked object;
+        # repeating it is idempotent and just pauses the interpreter again.
+        gc.collect(2)
     
     def memory_limited(self, func: Callable) -> Callable:
         """
         Decorator to enforce memory limits on functions.
         Raises MemoryError if limit exceeded.
         """
+        call_count = 0
+
         @wraps(func)
         def wrapper(*args, **kwargs):
-            # Check memory before execution
-            within_limit, current_mb = self.check_memory_limit()
-            if not within_limit:
-                self.force_cleanup()
+            nonlocal call_count
+
+            # Check memory before execution (rate-limited; RSS rarely
+            # changes between consecutive calls)
+            if call_count % MEMORY_CHECK_INTERVAL == 0:
                 within_limit, current_mb = self.check_memory_limit()
                 if not within_limit:
-                    raise MemoryError(
-                        f"Memory limit exceeded: {current_mb:.1f}MB / {self._memory_limit_mb}MB"
-                    )
+                    self.force_cleanup()
+                    within_limit, current_mb = self.check_memory_limit()
+                    if not within_limit:
+                        raise MemoryError(
+                            f"Memory limit exceeded: {current_mb:.1f}MB / {self._memory_limit_mb}MB"
+                        )
+            call_count += 1
             
             try:
                 result = func(*args, **kwargs)
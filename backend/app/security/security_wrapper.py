@@ -3,6 +3,7 @@ Unified security wrapper for easy integration by other agents.
 Provides a simple interface to all security features.
 """
 
+import gc
 from pathlib import Path
 from typing import Optional, Dict, Any, Callable
 from contextlib import contextmanager
@@ -25,17 +26,41 @@ class SecurityWrapper:
     
     def __init__(self, config: Optional[SecurityConfig] = None):
         self.config = config or SecurityConfig()
-        self.file_handler = SecureFileHandler(self.config)
         self.memory_manager = MemoryManager(self.config)
-        self.audit_logger = AuditLogger(config=self.config)
-        self.session_encryptor = SessionEncryptor()
         self.validator = SecurityValidator
-        
+
+        # Heavy components (temp dir + cleanup thread, audit DB, key
+        # generation) are created on first use rather than up front
+        self._file_handler = None
+        self._audit_logger = None
+        self._session_encryptor = None
+
         # Start memory monitoring
         self.memory_manager.start_monitoring()
-        
+
         # Session management
         self.sessions = {}
+
+    @property
+    def file_handler(self) -> SecureFileHandler:
+        """Secure file handler, created on first access."""
+        if self._file_handler is None:
+            self._file_handler = SecureFileHandler(self.config)
+        return self._file_handler
+
+    @property
+    def audit_logger(self) -> AuditLogger:
+        """Audit logger, created on first access."""
+        if self._audit_logger is None:
+            self._audit_logger = AuditLogger(config=self.config)
+        return self._audit_logger
+
+    @property
+    def session_encryptor(self) -> SessionEncryptor:
+        """Session encryptor, created on first access."""
+        if self._session_encryptor is None:
+            self._session_encryptor = SessionEncryptor()
+        return self._session_encryptor
     
     def create_session(self, user_id: Optional[str] = None) -> str:
         """Create a new secure session."""
@@ -126,16 +151,27 @@ class SecurityWrapper:
         """
         with self.secure_file_operation(session_id, file_path, action) as secure_path:
             with self.memory_limited_operation():
-                # Process the file
-                result = process_func(secure_path)
-                
-                # Validate output if it's extraction data
-                if isinstance(result, dict) and 'fields' in result:
-                    is_valid, error = self.validator.validate_extraction_data(result)
-                    if not is_valid:
-                        raise ValueError(f"Invalid extraction data: {error}")
-                
-                return result
+                # Processing allocates in a known transient spike; pause
+                # automatic GC and run one explicit collection at exit
+                # instead of many incremental ones mid-extraction.
+                gc_was_enabled = gc.isenabled()
+                if gc_was_enabled:
+                    gc.disable()
+                try:
+                    # Process the file
+                    result = process_func(secure_path)
+
+                    # Validate output if it's extraction data
+                    if isinstance(result, dict) and 'fields' in result:
+                        is_valid, error = self.validator.validate_extraction_data(result)
+                        if not is_valid:
+                            raise ValueError(f"Invalid extraction data: {error}")
+
+                    return result
+                finally:
+                    if gc_was_enabled:
+                        gc.enable()
+                    self.memory_manager.force_cleanup()
     
     def validate_input(self, data: Any, input_type: str) -> tuple[bool, Any]:
         """
@@ -183,8 +219,9 @@ class SecurityWrapper:
         for session_id in list(self.sessions.keys()):
             self.end_session(session_id)
         
-        # Cleanup files
-        self.file_handler.cleanup_all()
+        # Cleanup files (only if the handler was ever created)
+        if self._file_handler is not None:
+            self._file_handler.cleanup_all()
         
         # Force memory cleanup
         self.memory_manager.force_cleanup()
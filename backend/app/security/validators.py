@@ -5,6 +5,7 @@ Ensures all inputs are safe and prevents injection attacks.
 
 import re
 import os
+import ipaddress
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 import json
@@ -12,6 +13,27 @@ from urllib.parse import urlparse
 import mimetypes
 
 
+_ALLOWED_FILENAME_CHAR = re.compile(r'[\w\s.-]')
+
+
+class _FilenameSanitizeTable(dict):
+    """Translate table replacing disallowed filename characters with '_'.
+
+    str.translate looks entries up by code point; unseen code points are
+    classified once against the allowed-character pattern and memoized, so
+    repeated sanitization is a pure C-level table walk.
+    """
+
+    def __missing__(self, code_point):
+        char = chr(code_point)
+        replacement = char if _ALLOWED_FILENAME_CHAR.match(char) else '_'
+        self[code_point] = replacement
+        return replacement
+
+
+_FILENAME_SANITIZE_TABLE = _FilenameSanitizeTable()
+
+
 class SecurityValidator:
     """Validates and sanitizes all inputs for security."""
     
@@ -20,10 +42,35 @@ class SecurityValidator:
     CREDIT_CARD_PATTERN = re.compile(r'\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b')
     EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
     PHONE_PATTERN = re.compile(r'\b\d{3}[-.]?\d{3}[-.]?\d{4}\b')
+
+    # All sensitive patterns fused into one alternation so detection scans
+    # the text once; lastgroup identifies which type matched
+    SENSITIVE_DATA_PATTERN = re.compile(
+        f'(?P<ssn>{SSN_PATTERN.pattern})'
+        f'|(?P<credit_card>{CREDIT_CARD_PATTERN.pattern})'
+        f'|(?P<email>{EMAIL_PATTERN.pattern})'
+        f'|(?P<phone>{PHONE_PATTERN.pattern})'
+    )
+    _SENSITIVE_DATA_LABELS = (
+        ('ssn', 'SSN'),
+        ('credit_card', 'Credit Card'),
+        ('email', 'Email'),
+        ('phone', 'Phone Number'),
+    )
     
     # Dangerous path components
     DANGEROUS_PATH_PARTS = ['..', '~', '$', '|', '>', '<', '&', ';', '`', '\n', '\r']
+
+    # Compiled alternation over DANGEROUS_PATH_PARTS; longest parts first so
+    # '..' is reported rather than two '.' matches
+    _DANGEROUS_PATH_PATTERN = re.compile('|'.join(
+        re.escape(part)
+        for part in sorted(DANGEROUS_PATH_PARTS, key=len, reverse=True)
+    ))
     
+    # Extensions that signal a suspicious double extension (e.g. .pdf.exe)
+    SUSPICIOUS_EXTENSIONS = frozenset({'pdf', 'exe', 'bat', 'cmd', 'sh'})
+
     # Maximum sizes
     MAX_STRING_LENGTH = 10000
     MAX_FILENAME_LENGTH = 255
@@ -48,7 +95,7 @@ class SecurityValidator:
         filename = os.path.basename(filename)
         
         # Remove dangerous characters
-        sanitized = re.sub(r'[^\w\s.-]', '_', filename)
+        sanitized = filename.translate(_FILENAME_SANITIZE_TABLE)
         
         # Ensure it has a proper extension
         if '.' not in sanitized:
@@ -56,7 +103,7 @@ class SecurityValidator:
         
         # Check for double extensions (potential attack)
         parts = sanitized.split('.')
-        if len(parts) > 2 and parts[-2].lower() in ['pdf', 'exe', 'bat', 'cmd', 'sh']:
+        if len(parts) > 2 and parts[-2].lower() in cls.SUSPICIOUS_EXTENSIONS:
             return False, "Suspicious double extension"
         
         return True, sanitized
@@ -73,10 +120,10 @@ class SecurityValidator:
         if len(path_str) > cls.MAX_PATH_LENGTH:
             return False, "Path too long"
         
-        # Check for dangerous components
-        for dangerous in cls.DANGEROUS_PATH_PARTS:
-            if dangerous in path_str:
-                return False, f"Dangerous path component: {dangerous}"
+        # Check for dangerous components in a single scan
+        match = cls._DANGEROUS_PATH_PATTERN.search(path_str)
+        if match:
+            return False, f"Dangerous path component: {match.group()}"
         
         # Check for null bytes
         if '\x00' in path_str:
@@ -125,16 +172,21 @@ class SecurityValidator:
             else:
                 parsed = data
             
-            # Check for deeply nested structures (potential DoS)
-            def check_depth(obj, depth=0, max_depth=10):
-                if depth > max_depth:
-                    return False
-                if isinstance(obj, dict):
-                    return all(check_depth(v, depth + 1) for v in obj.values())
-                elif isinstance(obj, list):
-                    return all(check_depth(item, depth + 1) for item in obj)
+            # Check for deeply nested structures (potential DoS).
+            # Iterative with an explicit stack: no per-level Python frames
+            # or generator objects, and immune to recursion limits.
+            def check_depth(obj, max_depth=10):
+                stack = [(obj, 0)]
+                while stack:
+                    current, depth = stack.pop()
+                    if depth > max_depth:
+                        return False
+                    if isinstance(current, dict):
+                        stack.extend((v, depth + 1) for v in current.values())
+                    elif isinstance(current, list):
+                        stack.extend((item, depth + 1) for item in current)
                 return True
-            
+
             if not check_depth(parsed):
                 return False, "JSON too deeply nested"
             
@@ -151,22 +203,23 @@ class SecurityValidator:
         Check if text contains potentially sensitive data.
         Returns list of detected sensitive data types.
         """
-        detected = []
-        
-        if cls.SSN_PATTERN.search(text):
-            detected.append("SSN")
-        if cls.CREDIT_CARD_PATTERN.search(text):
-            detected.append("Credit Card")
-        if cls.EMAIL_PATTERN.search(text):
-            detected.append("Email")
-        if cls.PHONE_PATTERN.search(text):
-            detected.append("Phone Number")
-        
-        return detected
+        found = set()
+
+        for match in cls.SENSITIVE_DATA_PATTERN.finditer(text):
+            found.add(match.lastgroup)
+            if len(found) == len(cls._SENSITIVE_DATA_LABELS):
+                break
+
+        return [label for key, label in cls._SENSITIVE_DATA_LABELS if key in found]
     
     @classmethod
     def mask_sensitive_data(cls, text: str) -> str:
         """Mask potentially sensitive data in text."""
+        # Fast path: one fused scan; clean text (the common case) skips
+        # the four substitution passes and returns unchanged
+        if not cls.SENSITIVE_DATA_PATTERN.search(text):
+            return text
+
         # Mask SSNs
         text = cls.SSN_PATTERN.sub('XXX-XX-XXXX', text)
         
@@ -192,12 +245,17 @@ class SecurityValidator:
         """Validate that a file has the expected MIME type."""
         guessed_type, _ = mimetypes.guess_type(str(file_path))
         
-        # Also check file content for PDF
+        # Also check file content for PDF. Raw os.open/os.read skips the
+        # buffered file object for a 4-byte probe (mmap would cost a map
+        # and unmap for the same read).
         if expected_type == 'application/pdf':
             try:
-                with open(file_path, 'rb') as f:
-                    header = f.read(4)
-                    return header == b'%PDF'
+                fd = os.open(file_path, os.O_RDONLY)
+                try:
+                    header = os.read(fd, 4)
+                finally:
+                    os.close(fd)
+                return header == b'%PDF'
             except Exception:
                 return False
         
@@ -213,18 +271,24 @@ class SecurityValidator:
             if parsed.scheme == 'file':
                 return False
             
-            # Block localhost/local IPs
-            if parsed.hostname in ['localhost', '127.0.0.1', '0.0.0.0']:
+            # Block localhost by name
+            if parsed.hostname == 'localhost':
                 return False
-            
-            # Block local network IPs
-            if parsed.hostname and (
-                parsed.hostname.startswith('192.168.') or
-                parsed.hostname.startswith('10.') or
-                parsed.hostname.startswith('172.')
-            ):
-                return False
-            
+
+            # Block local/internal IP literals. ipaddress classifies the
+            # parsed address directly instead of string-prefix checks
+            # (which also wrongly blocked public 172.x ranges).
+            if parsed.hostname:
+                try:
+                    addr = ipaddress.ip_address(parsed.hostname)
+                except ValueError:
+                    pass  # Not an IP literal; regular hostname
+                else:
+                    if (addr.is_private or addr.is_loopback or
+                            addr.is_link_local or addr.is_unspecified or
+                            addr.is_reserved):
+                        return False
+
             return True
             
         except Exception:
@@ -49,11 +49,16 @@ class TestDataModels(unittest.TestCase):
 
 class TestPDFProcessor(unittest.TestCase):
     """Test PDFProcessor class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = PDFProcessor()
-    
+
+    @classmethod
+    def setUpClass(cls):
+        """Share one processor; no test depends on per-test state.
+
+        The processor does carry a content-hash result cache, but the
+        mocked inputs used here are unhashable and bypass it.
+        """
+        cls.processor = PDFProcessor()
+
     def test_pattern_matching(self):
         """Test regex patterns."""
         import re
@@ -292,10 +297,16 @@ class TestPDFProcessor(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests with actual PDF file."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = PDFProcessor()
-        self.test_pdf_path = "/Users/jacob/Documents/Projects/pdf Extractor/Check-EFTInfo - 2023-11-15T055920.964.pdf"
+    @classmethod
+    def setUpClass(cls):
+        """Share one processor; no test depends on per-test state.
+
+        Note the processor caches completed results by content hash, so
+        reprocessing the same real file exercises the cache, not the
+        extraction pipeline.
+        """
+        cls.processor = PDFProcessor()
+        cls.test_pdf_path = "/Users/jacob/Documents/Projects/pdf Extractor/Check-EFTInfo - 2023-11-15T055920.964.pdf"
     
     def test_process_actual_pdf(self):
         """Test processing an actual PDF file if available."""